@@ -12,6 +12,7 @@ A股自选股智能分析系统 - 分析服务层
 """
 
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 
 from src.analyzer import AnalysisResult
@@ -89,13 +90,17 @@ def analyze_stocks(
     if config is None:
         config = get_config()
     
-    results = []
-    for stock_code in stock_codes:
-        result = analyze_stock(stock_code, config, full_report, notifier)
-        if result:
-            results.append(result)
+    if not stock_codes:
+        return []
     
-    return results
+    # 各股票分析相互独立且以网络 I/O 为主，按配置并发执行（结果保持输入顺序）
+    max_workers = max(1, min(config.max_workers, len(stock_codes)))
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="analyze_") as executor:
+        analyzed = executor.map(
+            lambda code: analyze_stock(code, config, full_report, notifier),
+            stock_codes
+        )
+        return [result for result in analyzed if result]
 
 def perform_market_review(
     config: Config = None,
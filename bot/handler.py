@@ -9,7 +9,12 @@ Bot Webhook 处理器
 
 import json
 import logging
-from typing import Dict, Any, Optional, TYPE_CHECKING
+from typing import Dict, Any, Mapping, Optional, TYPE_CHECKING
+
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖，缺失时回退到标准库 json
+    orjson = None
 
 from bot.models import WebhookResponse
 from bot.dispatcher import get_dispatcher
@@ -49,7 +54,7 @@ def get_platform(platform_name: str) -> Optional['BotPlatform']:
 
 def handle_webhook(
     platform_name: str,
-    headers: Dict[str, str],
+    headers: Mapping[str, str],
     body: bytes,
     query_params: Optional[Dict[str, list]] = None
 ) -> WebhookResponse:
@@ -60,7 +65,7 @@ def handle_webhook(
     
     Args:
         platform_name: 平台名称 (feishu, dingtalk, wecom, telegram)
-        headers: HTTP 请求头
+        headers: HTTP 请求头（只读映射，可直接传入 http.client.HTTPMessage，键名不区分大小写）
         body: 请求体原始字节
         query_params: URL 查询参数（用于某些平台的验证）
         
@@ -82,14 +87,21 @@ def handle_webhook(
     if not platform:
         return WebhookResponse.error(f"Unknown platform: {platform_name}", 400)
     
-    # 解析 JSON 数据
+    # 解析 JSON 数据（orjson 直接解析 bytes，无需先解码为 str）
     try:
-        data = json.loads(body.decode('utf-8')) if body else {}
+        if not body:
+            data = {}
+        elif orjson is not None:
+            data = orjson.loads(body)
+        else:
+            data = json.loads(body.decode('utf-8'))
     except json.JSONDecodeError as e:
         logger.error(f"[BotHandler] JSON 解析失败: {e}")
         return WebhookResponse.error("Invalid JSON", 400)
     
-    logger.debug(f"[BotHandler] 请求数据: {json.dumps(data, ensure_ascii=False)[:500]}")
+    # 仅在 DEBUG 级别启用时才序列化请求数据，避免每次 Webhook 都整体 dumps 一遍
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"[BotHandler] 请求数据: {json.dumps(data, ensure_ascii=False)[:500]}")
     
     # 处理 Webhook
     message, challenge_response = platform.handle_webhook(headers, body, data)
@@ -90,7 +90,8 @@ class DingtalkPlatform(BotPlatform):
         ).digest()
         expected_sign = base64.b64encode(hmac_code).decode('utf-8')
         
-        if sign != expected_sign:
+        # 常量时间比较，避免按首个不同字节提前返回造成的时序侧信道
+        if not hmac.compare_digest(sign.encode('utf-8'), expected_sign.encode('utf-8')):
             logger.warning(f"[DingTalk] 签名验证失败")
             return False
         
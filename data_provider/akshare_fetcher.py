@@ -26,6 +26,7 @@ AkshareFetcher - 主数据源 (Priority 1)
 import logging
 import os
 import random
+import re
 import time
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -126,6 +127,10 @@ def _is_hk_code(stock_code: str) -> bool:
     return code.isdigit() and len(code) == 5
 
 
+# 美股代码：1-5个大写字母，可能包含一个点和字母（如 BRK.B）
+_US_CODE_RE = re.compile(r'^[A-Z]{1,5}(\.[A-Z])?$')
+
+
 def _is_us_code(stock_code: str) -> bool:
     """
     判断代码是否为美股
@@ -152,10 +157,8 @@ def _is_us_code(stock_code: str) -> bool:
         >>> _is_us_code('hk00700')
         False
     """
-    import re
     code = stock_code.strip().upper()
-    # 美股：1-5个大写字母，可能包含一个点和字母（如 BRK.B）
-    return bool(re.match(r'^[A-Z]{1,5}(\.[A-Z])?$', code))
+    return bool(_US_CODE_RE.match(code))
 
 
 class AkshareFetcher(BaseFetcher):
@@ -130,6 +130,10 @@ def _is_etf_code(stock_code: str) -> bool:
     return stock_code.startswith(etf_prefixes) and len(stock_code) == 6
 
 
+# 美股代码：1-5个大写字母，可能包含一个点和字母（如 BRK.B）
+_US_CODE_RE = re.compile(r'^[A-Z]{1,5}(\.[A-Z])?$')
+
+
 def _is_us_code(stock_code: str) -> bool:
     """
     判断代码是否为美股
@@ -139,7 +143,7 @@ def _is_us_code(stock_code: str) -> bool:
     - 可能包含 '.'，如 'BRK.B'
     """
     code = stock_code.strip().upper()
-    return bool(re.match(r'^[A-Z]{1,5}(\.[A-Z])?$', code))
+    return bool(_US_CODE_RE.match(code))
 
 
 class EfinanceFetcher(BaseFetcher):
@@ -34,6 +34,9 @@ import os
 
 logger = logging.getLogger(__name__)
 
+# 美股代码：1-5个大写字母，可能包含一个点和字母（如 BRK.B）
+_US_CODE_RE = re.compile(r'^[A-Z]{1,5}(\.[A-Z])?$')
+
 
 class YfinanceFetcher(BaseFetcher):
     """
@@ -84,12 +87,10 @@ class YfinanceFetcher(BaseFetcher):
             >>> fetcher._convert_stock_code('AAPL')
             'AAPL'
         """
-        import re
-
         code = stock_code.strip().upper()
 
         # 美股：1-5个大写字母（可能包含 .），直接返回
-        if re.match(r'^[A-Z]{1,5}(\.[A-Z])?$', code):
+        if _US_CODE_RE.match(code):
             logger.debug(f"识别为美股代码: {code}")
             return code
 
@@ -296,7 +297,7 @@ class YfinanceFetcher(BaseFetcher):
         - 可能包含 '.'，如 'BRK.B'
         """
         code = stock_code.strip().upper()
-        return bool(re.match(r'^[A-Z]{1,5}(\.[A-Z])?$', code))
+        return bool(_US_CODE_RE.match(code))
 
     def get_realtime_quote(self, stock_code: str) -> Optional[UnifiedRealtimeQuote]:
         """
@@ -16,12 +16,13 @@ from typing import List, Optional
 from dotenv import load_dotenv, dotenv_values
 from dataclasses import dataclass, field
 
+# 项目根目录下的 .env（src/config.py -> src/ -> root），模块加载时解析一次
+_ENV_FILE = Path(__file__).parent.parent / '.env'
+
 
 def setup_env():
     """初始化环境变量（支持从 .env 加载）"""
-    # src/config.py -> src/ -> root
-    env_path = Path(__file__).parent.parent / '.env'
-    load_dotenv(dotenv_path=env_path)
+    load_dotenv(dotenv_path=_ENV_FILE)
 
 
 @dataclass
@@ -431,7 +432,7 @@ class Config:
         """
         # 优先从 .env 文件读取最新配置，这样即使在容器环境中修改了 .env 文件，
         # 也能获取到最新的股票列表配置
-        env_path = Path(__file__).parent.parent / '.env'
+        env_path = _ENV_FILE
         stock_list_str = ''
         if env_path.exists():
             # 直接从 .env 文件读取最新的配置
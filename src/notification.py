@@ -22,6 +22,7 @@ import smtplib
 import re
 import markdown2
 from datetime import datetime
+from pathlib import Path
 from typing import List, Dict, Any, Optional
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
@@ -42,6 +43,9 @@ from bot.models import BotMessage
 
 logger = logging.getLogger(__name__)
 
+# 日报保存目录（项目根目录下的 reports）
+_REPORTS_DIR = Path(__file__).parent.parent / 'reports'
+
 
 class NotificationChannel(Enum):
     """通知渠道类型"""
@@ -3085,17 +3089,14 @@ class NotificationService:
         Returns:
             保存的文件路径
         """
-        from pathlib import Path
-        
         if filename is None:
             date_str = datetime.now().strftime('%Y%m%d')
             filename = f"report_{date_str}.md"
         
-        # 确保 reports 目录存在（使用项目根目录下的 reports）
-        reports_dir = Path(__file__).parent.parent / 'reports'
-        reports_dir.mkdir(parents=True, exist_ok=True)
+        # 确保 reports 目录存在（仅写入路径需要创建目录）
+        _REPORTS_DIR.mkdir(parents=True, exist_ok=True)
         
-        filepath = reports_dir / filename
+        filepath = _REPORTS_DIR / filename
         
         with open(filepath, 'w', encoding='utf-8') as f:
             f.write(content)
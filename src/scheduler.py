@@ -132,7 +132,8 @@ class Scheduler:
             time.sleep(30)  # 每30秒检查一次
             
             # 每小时打印一次心跳
-            if datetime.now().minute == 0 and datetime.now().second < 30:
+            now = datetime.now()
+            if now.minute == 0 and now.second < 30:
                 logger.info(f"调度器运行中... 下次执行: {self._get_next_run_time()}")
         
         logger.info("调度器已停止")
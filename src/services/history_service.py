@@ -16,6 +16,19 @@ from typing import Optional, Dict, Any, List
 
 from src.storage import DatabaseManager
 
+try:
+    import orjson
+
+    def _json_loads(text):
+        """优先使用 orjson 解析；遇到 NaN/Infinity 等非严格 JSON 时回退到标准库"""
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            # 历史数据可能由标准库 json 写入，包含 orjson 拒绝的 NaN/Infinity
+            return json.loads(text)
+except ImportError:  # orjson 为可选依赖，缺失时回退到标准库 json
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 
@@ -76,13 +89,14 @@ class HistoryService:
             # 计算 offset
             offset = (page - 1) * limit
             
-            # 使用新的分页查询方法
+            # 使用新的分页查询方法（列表只需摘要字段，不加载报告大字段）
             records, total = self.db.get_analysis_history_paginated(
                 code=stock_code,
                 start_date=start_dt,
                 end_date=end_dt,
                 offset=offset,
-                limit=limit
+                limit=limit,
+                include_details=False
             )
             
             # 转换为响应格式
@@ -130,7 +144,7 @@ class HistoryService:
             raw_result = None
             if record.raw_result:
                 try:
-                    raw_result = json.loads(record.raw_result)
+                    raw_result = _json_loads(record.raw_result)
                 except json.JSONDecodeError:
                     raw_result = record.raw_result
             
@@ -138,7 +152,7 @@ class HistoryService:
             context_snapshot = None
             if record.context_snapshot:
                 try:
-                    context_snapshot = json.loads(record.context_snapshot)
+                    context_snapshot = _json_loads(record.context_snapshot)
                 except json.JSONDecodeError:
                     context_snapshot = record.context_snapshot
             
@@ -16,11 +16,18 @@ import hashlib
 import json
 import logging
 import re
-from datetime import datetime, date, timedelta
+import threading
+from datetime import datetime, date, time, timedelta
+from enum import Enum
 from typing import Optional, List, Dict, Any, TYPE_CHECKING, Tuple
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖，缺失时回退到标准库 json
+    orjson = None
 from sqlalchemy import (
     create_engine,
     Column,
@@ -35,11 +42,14 @@ from sqlalchemy import (
     select,
     and_,
     desc,
+    bindparam,
 )
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import (
     declarative_base,
     sessionmaker,
     Session,
+    defer,
 )
 from sqlalchemy.exc import IntegrityError
 
@@ -53,6 +63,31 @@ Base = declarative_base()
 if TYPE_CHECKING:
     from src.search_service import SearchResponse
 
+# 日线 UPSERT 写入/更新的行情与指标字段
+_DAILY_VALUE_COLUMNS = (
+    'open', 'high', 'low', 'close', 'volume', 'amount', 'pct_chg',
+    'ma5', 'ma10', 'ma20', 'volume_ratio',
+)
+# 每批 UPSERT 的行数（控制单条 SQL 的绑定参数数量，兼容旧版 SQLite 的 999 上限）
+_DAILY_UPSERT_BATCH_SIZE = 50
+
+# 狙击点位文本中的数值（如 "理想买入点：125.5元"）
+_SNIPER_NUMBER_RE = re.compile(r"-?\d+(?:\.\d+)?")
+
+
+def _json_default(obj: Any) -> Any:
+    """JSON 序列化兜底：按类型显式分派，其余对象转为字符串"""
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, np.generic):
+        # numpy 标量（如 np.float64 / np.int64）还原为 Python 数值，避免被存为字符串
+        return obj.item()
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    return str(obj)
+
 
 # === 数据模型定义 ===
 
@@ -239,6 +274,39 @@ class AnalysisHistory(Base):
         }
 
 
+# === 预构建查询语句 ===
+# 高频小查询在模块加载时构建一次，调用时仅传入绑定参数，
+# 省去每次调用重新构造表达式对象，并稳定命中 SQLAlchemy 的编译缓存
+
+_SEL_DAILY_EXISTS = select(StockDaily.id).where(
+    and_(
+        StockDaily.code == bindparam('code'),
+        StockDaily.date == bindparam('target_date'),
+    )
+).limit(1)
+
+_SEL_DAILY_LATEST = (
+    select(StockDaily)
+    .where(StockDaily.code == bindparam('code'))
+    .order_by(desc(StockDaily.date))
+    .limit(bindparam('days'))
+)
+
+_SEL_DAILY_RANGE = (
+    select(StockDaily)
+    .where(
+        and_(
+            StockDaily.code == bindparam('code'),
+            StockDaily.date >= bindparam('start_date'),
+            StockDaily.date <= bindparam('end_date'),
+        )
+    )
+    .order_by(StockDaily.date)
+)
+
+_SEL_NEWS_BY_URL = select(NewsIntel).where(NewsIntel.url == bindparam('url'))
+
+
 class DatabaseManager:
     """
     数据库管理器 - 单例模式
@@ -251,6 +319,7 @@ class DatabaseManager:
     
     _instance: Optional['DatabaseManager'] = None
     _initialized: bool = False
+    _lock = threading.Lock()
     
     def __new__(cls, *args, **kwargs):
         """单例模式实现"""
@@ -290,6 +359,10 @@ class DatabaseManager:
         # 创建所有表
         Base.metadata.create_all(self._engine)
 
+        # 已确认存在的日线数据 {(code, date)}，只缓存命中结果，跨日自动清空
+        self._daily_data_cache: set = set()
+        self._daily_data_cache_day: date = date.today()
+
         self._initialized = True
         logger.info(f"数据库初始化完成: {db_url}")
 
@@ -298,10 +371,13 @@ class DatabaseManager:
     
     @classmethod
     def get_instance(cls) -> 'DatabaseManager':
-        """获取单例实例"""
-        if cls._instance is None:
-            cls._instance = cls()
-        return cls._instance
+        """获取单例实例（线程安全，初始化完成后无锁）"""
+        instance = cls._instance
+        if instance is None or not instance._initialized:
+            with cls._lock:
+                # __new__ 返回已有实例，__init__ 对已初始化的实例直接返回
+                instance = cls()
+        return instance
     
     @classmethod
     def reset_instance(cls) -> None:
@@ -366,17 +442,32 @@ class DatabaseManager:
         if target_date is None:
             target_date = date.today()
         
+        if (code, target_date) in self._daily_data_cache:
+            return True
+        
         with self.get_session() as session:
             result = session.execute(
-                select(StockDaily).where(
-                    and_(
-                        StockDaily.code == code,
-                        StockDaily.date == target_date
-                    )
-                )
+                _SEL_DAILY_EXISTS,
+                {'code': code, 'target_date': target_date},
             ).scalar_one_or_none()
             
-            return result is not None
+            if result is None:
+                return False
+        
+        self._remember_daily_data(code, [target_date])
+        return True
+    
+    def _remember_daily_data(self, code: str, dates: List[date]) -> None:
+        """
+        记录已存在的日线数据，供 has_today_data 快速命中
+        
+        日线数据只增不删，因此只缓存"存在"的结果；跨日时清空以限制内存占用
+        """
+        today = date.today()
+        if today != self._daily_data_cache_day:
+            self._daily_data_cache = set()
+            self._daily_data_cache_day = today
+        self._daily_data_cache.update((code, d) for d in dates)
     
     def get_latest_data(
         self, 
@@ -397,10 +488,8 @@ class DatabaseManager:
         """
         with self.get_session() as session:
             results = session.execute(
-                select(StockDaily)
-                .where(StockDaily.code == code)
-                .order_by(desc(StockDaily.date))
-                .limit(days)
+                _SEL_DAILY_LATEST,
+                {'code': code, 'days': days},
             ).scalars().all()
             
             return list(results)
@@ -428,6 +517,8 @@ class DatabaseManager:
             return 0
 
         saved_count = 0
+        # 同一批新闻共用一个抓取时间戳
+        fetched_at = datetime.now()
 
         with self.get_session() as session:
             try:
@@ -450,7 +541,7 @@ class DatabaseManager:
 
                     # 优先按 URL 或兜底键去重
                     existing = session.execute(
-                        select(NewsIntel).where(NewsIntel.url == url_key)
+                        _SEL_NEWS_BY_URL, {'url': url_key}
                     ).scalar_one_or_none()
 
                     if existing:
@@ -461,7 +552,7 @@ class DatabaseManager:
                         existing.snippet = snippet or existing.snippet
                         existing.source = source or existing.source
                         existing.published_date = published_date or existing.published_date
-                        existing.fetched_at = datetime.now()
+                        existing.fetched_at = fetched_at
 
                         if query_context:
                             existing.query_id = query_context.get("query_id") or existing.query_id
@@ -486,7 +577,7 @@ class DatabaseManager:
                                     url=url_key,
                                     source=source,
                                     published_date=published_date,
-                                    fetched_at=datetime.now(),
+                                    fetched_at=fetched_at,
                                     query_id=(query_context or {}).get("query_id"),
                                     query_source=(query_context or {}).get("query_source"),
                                     requester_platform=(query_context or {}).get("requester_platform"),
@@ -644,7 +735,8 @@ class DatabaseManager:
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
         offset: int = 0,
-        limit: int = 20
+        limit: int = 20,
+        include_details: bool = True
     ) -> Tuple[List[AnalysisHistory], int]:
         """
         分页查询分析历史记录（带总数）
@@ -655,6 +747,8 @@ class DatabaseManager:
             end_date: 结束日期（含）
             offset: 偏移量（跳过前 N 条）
             limit: 每页数量
+            include_details: 是否加载大字段（raw_result/news_content/context_snapshot），
+                列表场景传 False 可避免读取与解码整段报告内容
             
         Returns:
             Tuple[List[AnalysisHistory], int]: (记录列表, 总数)
@@ -688,6 +782,12 @@ class DatabaseManager:
                 .offset(offset)
                 .limit(limit)
             )
+            if not include_details:
+                data_query = data_query.options(
+                    defer(AnalysisHistory.raw_result),
+                    defer(AnalysisHistory.news_content),
+                    defer(AnalysisHistory.context_snapshot),
+                )
             results = session.execute(data_query).scalars().all()
             
             return list(results), total
@@ -711,15 +811,8 @@ class DatabaseManager:
         """
         with self.get_session() as session:
             results = session.execute(
-                select(StockDaily)
-                .where(
-                    and_(
-                        StockDaily.code == code,
-                        StockDaily.date >= start_date,
-                        StockDaily.date <= end_date
-                    )
-                )
-                .order_by(StockDaily.date)
+                _SEL_DAILY_RANGE,
+                {'code': code, 'start_date': start_date, 'end_date': end_date},
             ).scalars().all()
             
             return list(results)
@@ -734,8 +827,8 @@ class DatabaseManager:
         保存日线数据到数据库
         
         策略：
-        - 使用 UPSERT 逻辑（存在则更新，不存在则插入）
-        - 跳过已存在的数据，避免重复
+        - 使用 UPSERT 逻辑（INSERT ... ON CONFLICT DO UPDATE，存在则更新，不存在则插入）
+        - 按批写入，避免逐行 SELECT 再 INSERT/UPDATE 的往返
         
         Args:
             df: 包含日线数据的 DataFrame
@@ -749,65 +842,52 @@ class DatabaseManager:
             logger.warning(f"保存数据为空，跳过 {code}")
             return 0
         
-        saved_count = 0
+        rows: List[Dict[str, Any]] = []
+        for _, row in df.iterrows():
+            # 解析日期
+            row_date = row.get('date')
+            if isinstance(row_date, str):
+                row_date = datetime.strptime(row_date, '%Y-%m-%d').date()
+            elif isinstance(row_date, datetime):
+                row_date = row_date.date()
+            elif isinstance(row_date, pd.Timestamp):
+                row_date = row_date.date()
+            
+            values = {column: row.get(column) for column in _DAILY_VALUE_COLUMNS}
+            values.update(code=code, date=row_date, data_source=data_source)
+            rows.append(values)
+        
+        saved_dates = [values['date'] for values in rows]
         
         with self.get_session() as session:
             try:
-                for _, row in df.iterrows():
-                    # 解析日期
-                    row_date = row.get('date')
-                    if isinstance(row_date, str):
-                        row_date = datetime.strptime(row_date, '%Y-%m-%d').date()
-                    elif isinstance(row_date, datetime):
-                        row_date = row_date.date()
-                    elif isinstance(row_date, pd.Timestamp):
-                        row_date = row_date.date()
-                    
-                    # 检查是否已存在
-                    existing = session.execute(
-                        select(StockDaily).where(
+                # 查询已有日期，仅用于统计新增条数；IN 列表同样按批拆分，控制绑定参数数量
+                unique_dates = list(set(saved_dates))
+                existing_dates = set()
+                for i in range(0, len(unique_dates), _DAILY_UPSERT_BATCH_SIZE):
+                    existing_dates.update(session.execute(
+                        select(StockDaily.date).where(
                             and_(
                                 StockDaily.code == code,
-                                StockDaily.date == row_date
+                                StockDaily.date.in_(unique_dates[i:i + _DAILY_UPSERT_BATCH_SIZE])
                             )
                         )
-                    ).scalar_one_or_none()
-                    
-                    if existing:
-                        # 更新现有记录
-                        existing.open = row.get('open')
-                        existing.high = row.get('high')
-                        existing.low = row.get('low')
-                        existing.close = row.get('close')
-                        existing.volume = row.get('volume')
-                        existing.amount = row.get('amount')
-                        existing.pct_chg = row.get('pct_chg')
-                        existing.ma5 = row.get('ma5')
-                        existing.ma10 = row.get('ma10')
-                        existing.ma20 = row.get('ma20')
-                        existing.volume_ratio = row.get('volume_ratio')
-                        existing.data_source = data_source
-                        existing.updated_at = datetime.now()
-                    else:
-                        # 创建新记录
-                        record = StockDaily(
-                            code=code,
-                            date=row_date,
-                            open=row.get('open'),
-                            high=row.get('high'),
-                            low=row.get('low'),
-                            close=row.get('close'),
-                            volume=row.get('volume'),
-                            amount=row.get('amount'),
-                            pct_chg=row.get('pct_chg'),
-                            ma5=row.get('ma5'),
-                            ma10=row.get('ma10'),
-                            ma20=row.get('ma20'),
-                            volume_ratio=row.get('volume_ratio'),
-                            data_source=data_source,
-                        )
-                        session.add(record)
-                        saved_count += 1
+                    ).scalars().all())
+                saved_count = len(unique_dates) - len(existing_dates)
+                
+                # INSERT ... ON CONFLICT(code, date) DO UPDATE，按批写入
+                now = datetime.now()
+                for i in range(0, len(rows), _DAILY_UPSERT_BATCH_SIZE):
+                    stmt = sqlite_insert(StockDaily).values(rows[i:i + _DAILY_UPSERT_BATCH_SIZE])
+                    update_columns = {
+                        column: stmt.excluded[column]
+                        for column in (*_DAILY_VALUE_COLUMNS, 'data_source')
+                    }
+                    update_columns['updated_at'] = now
+                    session.execute(stmt.on_conflict_do_update(
+                        index_elements=['code', 'date'],
+                        set_=update_columns,
+                    ))
                 
                 session.commit()
                 logger.info(f"保存 {code} 数据成功，新增 {saved_count} 条")
@@ -817,6 +897,7 @@ class DatabaseManager:
                 logger.error(f"保存 {code} 数据失败: {e}")
                 raise
         
+        self._remember_daily_data(code, saved_dates)
         return saved_count
     
     def get_analysis_context(
@@ -939,9 +1020,21 @@ class DatabaseManager:
     def _safe_json_dumps(data: Any) -> str:
         """
         安全序列化为 JSON 字符串
+
+        优先使用 orjson（C 实现，直接输出 UTF-8，numpy 标量/数组按数值序列化），
+        失败时回退到标准库 json；两者均输出紧凑格式（无缩进、无多余空格），与 orjson 输出保持一致
         """
+        if orjson is not None:
+            try:
+                return orjson.dumps(
+                    data,
+                    default=_json_default,
+                    option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+                ).decode("utf-8")
+            except orjson.JSONEncodeError:
+                pass
         try:
-            return json.dumps(data, ensure_ascii=False, default=str)
+            return json.dumps(data, ensure_ascii=False, separators=(",", ":"), default=_json_default)
         except Exception:
             return json.dumps(str(data), ensure_ascii=False)
 
@@ -971,7 +1064,7 @@ class DatabaseManager:
         if not text:
             return None
 
-        match = re.search(r"-?\d+(?:\.\d+)?", text)
+        match = _SNIPER_NUMBER_RE.search(text)
         if not match:
             return None
         try:
@@ -16,6 +16,7 @@ import unittest
 from src.config import Config
 from src.storage import DatabaseManager, AnalysisHistory
 from src.analyzer import AnalysisResult
+from src.services.history_service import HistoryService
 
 
 class AnalysisHistoryTestCase(unittest.TestCase):
@@ -108,6 +109,52 @@ class AnalysisHistoryTestCase(unittest.TestCase):
                 self.fail("未找到保存的历史记录")
             self.assertIsNone(row.context_snapshot)
 
+    def test_paginated_history_without_details(self) -> None:
+        """列表查询不加载报告大字段，摘要字段仍可读取"""
+        result = self._build_result()
+        self.db.save_analysis_history(
+            result=result,
+            query_id="query_003",
+            report_type="simple",
+            news_content="新闻摘要",
+            context_snapshot={"foo": "bar"},
+            save_snapshot=True
+        )
+
+        records, total = self.db.get_analysis_history_paginated(
+            code="600519",
+            include_details=False
+        )
+
+        self.assertEqual(total, 1)
+        self.assertEqual(records[0].query_id, "query_003")
+        self.assertEqual(records[0].operation_advice, "持有")
+        self.assertNotIn("raw_result", records[0].__dict__)
+        self.assertNotIn("context_snapshot", records[0].__dict__)
+
+
+    def test_history_detail_decodes_nan_snapshot(self) -> None:
+        """标准库写入的含 NaN 快照仍能解析为字典，而不是原始字符串"""
+        self.db.save_analysis_history(
+            result=self._build_result(),
+            query_id="query_004",
+            report_type="simple",
+            news_content="新闻摘要",
+            context_snapshot=None,
+            save_snapshot=True
+        )
+        with self.db.get_session() as session:
+            row = session.query(AnalysisHistory).filter_by(query_id="query_004").first()
+            row.context_snapshot = '{"a": NaN}'
+            session.commit()
+
+        detail = HistoryService(self.db).get_history_detail("query_004")
+
+        self.assertIsNotNone(detail)
+        snapshot = detail["context_snapshot"]
+        self.assertIsInstance(snapshot, dict)
+        self.assertNotEqual(snapshot["a"], snapshot["a"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+"""
+===================================
+A股自选股智能分析系统 - 股票代码格式校验单元测试
+===================================
+
+职责：
+1. 固定 /analysis 接口接受的股票代码格式
+2. 验证非法格式（含全角数字）被拒绝
+"""
+
+import unittest
+
+from web.handlers import _is_valid_stock_code
+
+
+class StockCodeValidationTestCase(unittest.TestCase):
+    """股票代码格式校验测试（输入为已转大写的代码）"""
+
+    def test_accepts_supported_formats(self) -> None:
+        """A股 / 港股 / 美股（含 1-2 位后缀）及 HK 开头的美股代码均可通过"""
+        for code in ("600519", "000001", "HK00700", "AAPL", "A", "BRK.B", "RDS.AB", "HKEX"):
+            with self.subTest(code=code):
+                self.assertTrue(_is_valid_stock_code(code))
+
+    def test_rejects_invalid_formats(self) -> None:
+        """长度、后缀或字符不合法的代码被拒绝"""
+        for code in (
+            "", "60051", "6005190", "HK0070", "HK000700", "ABCDEF",
+            "ABC.", ".B", "A.B.C", "AB.CDE", "A1", "A-B", "600519 ",
+        ):
+            with self.subTest(code=code):
+                self.assertFalse(_is_valid_stock_code(code))
+
+    def test_rejects_full_width_digits(self) -> None:
+        """全角数字不视为合法 A股 / 港股代码"""
+        for code in ("６００５１９", "HK００７００"):
+            with self.subTest(code=code):
+                self.assertFalse(_is_valid_stock_code(code))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""
+===================================
+A股自选股智能分析系统 - 日线数据存储单元测试
+===================================
+
+职责：
+1. 验证日线数据 UPSERT 写入（新增计数、重复写入更新）
+2. 验证 has_today_data 断点续传判断
+"""
+
+import os
+import tempfile
+import unittest
+from datetime import date
+
+import pandas as pd
+
+from src.config import Config
+from src.storage import DatabaseManager, StockDaily
+
+
+class StockDailyStorageTestCase(unittest.TestCase):
+    """日线数据存储测试"""
+
+    def setUp(self) -> None:
+        """为每个用例初始化独立数据库"""
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self._db_path = os.path.join(self._temp_dir.name, "test_stock_daily.db")
+        os.environ["DATABASE_PATH"] = self._db_path
+
+        Config._instance = None
+        DatabaseManager.reset_instance()
+        self.db = DatabaseManager.get_instance()
+
+    def tearDown(self) -> None:
+        """清理资源"""
+        DatabaseManager.reset_instance()
+        self._temp_dir.cleanup()
+
+    def _build_df(self, dates, close: float) -> pd.DataFrame:
+        """构造日线 DataFrame"""
+        return pd.DataFrame({
+            'date': dates,
+            'open': [close] * len(dates),
+            'high': [close] * len(dates),
+            'low': [close] * len(dates),
+            'close': [close] * len(dates),
+            'volume': [1000.0] * len(dates),
+            'amount': [close * 1000] * len(dates),
+            'pct_chg': [0.0] * len(dates),
+        })
+
+    def test_save_daily_data_upsert(self) -> None:
+        """重复日期更新原记录，仅新日期计入新增"""
+        first = self._build_df([date(2026, 1, 5), date(2026, 1, 6)], close=10.0)
+        self.assertEqual(self.db.save_daily_data(first, "600519", "TestSource"), 2)
+
+        second = self._build_df([date(2026, 1, 6), date(2026, 1, 7)], close=12.0)
+        self.assertEqual(self.db.save_daily_data(second, "600519", "OtherSource"), 1)
+
+        with self.db.get_session() as session:
+            rows = session.query(StockDaily).order_by(StockDaily.date).all()
+            self.assertEqual(len(rows), 3)
+            self.assertEqual(rows[0].close, 10.0)
+            self.assertEqual(rows[1].close, 12.0)
+            self.assertEqual(rows[1].data_source, "OtherSource")
+            self.assertIsNotNone(rows[1].updated_at)
+
+    def test_has_today_data(self) -> None:
+        """写入后可命中，未写入的日期返回 False"""
+        target = date(2026, 1, 5)
+        self.assertFalse(self.db.has_today_data("600519", target))
+
+        self.db.save_daily_data(self._build_df([target], close=10.0), "600519")
+
+        self.assertTrue(self.db.has_today_data("600519", target))
+        self.assertFalse(self.db.has_today_data("000001", target))
+
+
+if __name__ == "__main__":
+    unittest.main()
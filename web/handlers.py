@@ -16,15 +16,31 @@ Web 处理器层 - 请求处理
 
 from __future__ import annotations
 
+import gzip
+import hashlib
 import json
-import re
+import os
+import socket
+import threading
+import time
 import logging
+from collections import OrderedDict
+from email.utils import formatdate
 from http import HTTPStatus
 from datetime import datetime
-from typing import Dict, Any, Optional, TYPE_CHECKING
+from typing import Dict, Any, List, Mapping, Optional, Tuple, TYPE_CHECKING
+
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖，缺失时回退到标准库 json
+    orjson = None
 
 from web.services import get_config_service, get_analysis_service
-from web.templates import render_config_page
+from web.templates import (
+    render_config_page,
+    BASE_CSS_BYTES, BASE_CSS_VERSION,
+    ANALYSIS_JS_BYTES, ANALYSIS_JS_VERSION,
+)
 from src.enums import ReportType
 
 if TYPE_CHECKING:
@@ -32,11 +48,165 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# 已结束（状态不再变化）的任务状态，其响应体可缓存复用
+_TERMINAL_TASK_STATUSES = frozenset({"completed", "failed"})
+# 任务状态响应体缓存的最大条目数（超出后淘汰最早缓存的任务）
+_TASK_BODY_CACHE_SIZE = 256
+
+# 布尔查询参数取值
+_TRUTHY_VALUES = frozenset({"1", "true", "yes", "y", "on"})
+_FALSY_VALUES = frozenset({"0", "false", "no", "n", "off"})
+
+
+def _is_valid_stock_code(code: str) -> bool:
+    """
+    校验（已转大写的）股票代码格式
+    
+    A股(6位数字) / 港股(HK+5位数字) / 美股(1-5个字母+可选.+1-2个后缀字母)；
+    仅用 C 实现的 str 方法判断，不经过正则状态机（HKEX 等 HK 开头的美股代码由美股分支匹配）
+    """
+    if not code.isascii():
+        return False
+    n = len(code)
+    if n == 6 and code.isdigit():
+        return True
+    if n == 7 and code.startswith("HK") and code[2:].isdigit():
+        return True
+    base, dot, suffix = code.partition(".")
+    if not (0 < len(base) <= 5 and base.isalpha()):
+        return False
+    return not dot or (0 < len(suffix) <= 2 and suffix.isalpha())
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """判断请求头 If-None-Match（可为逗号分隔的多个 ETag，或通配符 *）是否匹配指定 ETag"""
+    if not if_none_match:
+        return False
+    tags = [t.strip() for t in if_none_match.split(",")]
+    return "*" in tags or etag in tags
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """
+    判断请求头 Accept-Encoding 是否接受 gzip
+    
+    按逗号拆分编码并读取 q 值：显式的 gzip（或 x-gzip）优先，其次是通配符 *；
+    q=0 表示明确拒绝，非法 q 值按拒绝处理
+    """
+    accept_encoding = accept_encoding.lower()
+    if "gzip" not in accept_encoding and "*" not in accept_encoding:
+        return False
+    gzip_q: Optional[float] = None
+    star_q: Optional[float] = None
+    for token in accept_encoding.split(","):
+        coding, _, params = token.partition(";")
+        coding = coding.strip()
+        if coding not in ("gzip", "x-gzip", "*"):
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if coding == "*":
+            star_q = q
+        else:
+            gzip_q = q
+    if gzip_q is None:
+        gzip_q = star_q
+    return gzip_q is not None and gzip_q > 0
+
+
+def _first_param(params: Dict[str, list], key: str, default: str = "") -> str:
+    """取查询/表单参数的首个值并去除首尾空白，缺失时返回默认值（仅一次字典查找）"""
+    values = params.get(key)
+    return values[0].strip() if values else default
+
 
 # ============================================================
 # 响应辅助类
 # ============================================================
 
+# 响应头模板：直接以 bytes 格式化（PEP 461），省去逐行 send_header 拼接与编码
+# 第一段为状态行 + Server 等固定头部（按处理器类与状态码缓存），其余为逐请求变化的头部
+_RESPONSE_HEAD_TEMPLATE = (
+    b"%s"
+    b"Date: %s\r\n"
+    b"Content-Type: %s\r\n"
+    b"Content-Length: %d\r\n"
+    b"%s"
+    b"\r\n"
+)
+# 304 响应不携带响应体，也不发送 Content-Type / Content-Length
+_NOT_MODIFIED_HEAD_TEMPLATE = (
+    b"%s"
+    b"Date: %s\r\n"
+    b"%s"
+    b"\r\n"
+)
+# HTTP/1.0 客户端显式请求长连接时需回显该头部，否则客户端会在响应后自行断开
+_KEEP_ALIVE_HEADER = b"Connection: keep-alive\r\n"
+# HTTP/1.1 连接将在响应后关闭时（客户端要求或请求体无法分帧）告知客户端不要复用
+_CLOSE_HEADER = b"Connection: close\r\n"
+# 超过该大小的响应体单独写出，避免为合并写入而复制整个响应体
+_COALESCE_BODY_LIMIT = 64 * 1024
+
+# Date 响应头只需秒级精度：缓存 (秒级时间戳, 已编码的头部值)，每秒最多格式化一次
+_date_header_cache: tuple = (0, b"")
+
+
+def _http_date() -> bytes:
+    """返回当前秒的 HTTP Date 头部值（bytes）"""
+    global _date_header_cache
+    now = int(time.time())
+    cached = _date_header_cache
+    if cached[0] != now:
+        # 整体替换元组，多线程并发刷新时也不会读到不一致的值
+        cached = (now, formatdate(now, usegmt=True).encode('ascii'))
+        _date_header_cache = cached
+    return cached[1]
+
+
+# 固定头部缓存：{(处理器类, 状态码): b"状态行\r\nServer: ...\r\n"}
+_fixed_head_cache: Dict[tuple, bytes] = {}
+
+
+def _fixed_head(handler: 'BaseHTTPRequestHandler', status: HTTPStatus) -> bytes:
+    """返回状态行与 Server 头部（协议版本与服务器标识在处理器类上固定）"""
+    key = (type(handler), status)
+    block = _fixed_head_cache.get(key)
+    if block is None:
+        block = b"%s %d %s\r\nServer: %s\r\n" % (
+            handler.protocol_version.encode('ascii'),
+            status.value,
+            status.phrase.encode('ascii'),
+            handler.version_string().encode('ascii'),
+        )
+        _fixed_head_cache[key] = block
+    return block
+
+
+def _sendmsg_all(sock: socket.socket, head: bytes, body: bytes) -> None:
+    """
+    以 scatter/gather 方式（writev）发送响应头与响应体
+    
+    两段缓冲区直接交给内核，无需先拼接成新的 bytes；
+    部分发送时用 memoryview 切片续传，同样不复制数据
+    """
+    views = [memoryview(head), memoryview(body)]
+    while views:
+        sent = sock.sendmsg(views)
+        while sent and views:
+            if sent >= len(views[0]):
+                sent -= len(views.pop(0))
+            else:
+                views[0] = views[0][sent:]
+                sent = 0
+
+
 class Response:
     """HTTP 响应封装"""
     
@@ -49,14 +219,69 @@ class Response:
         self.body = body
         self.status = status
         self.content_type = content_type
+        # 附加响应头（如缓存控制），由调用方通过 add_header 显式设置
+        self.headers: List[Tuple[str, str]] = []
+    
+    def add_header(self, name: str, value: str) -> 'Response':
+        """添加附加响应头，返回自身以便链式调用"""
+        self.headers.append((name, value))
+        return self
+    
+    def _encode_headers(self) -> bytes:
+        """编码附加响应头"""
+        if not self.headers:
+            return b""
+        return b"".join(
+            b"%s: %s\r\n" % (name.encode('latin-1'), value.encode('latin-1'))
+            for name, value in self.headers
+        )
     
     def send(self, handler: 'BaseHTTPRequestHandler') -> None:
         """发送响应到客户端"""
-        handler.send_response(self.status)
-        handler.send_header("Content-Type", self.content_type)
-        handler.send_header("Content-Length", str(len(self.body)))
-        handler.end_headers()
-        handler.wfile.write(self.body)
+        handler.log_request(self.status.value)
+        request_version = handler.request_version
+        if request_version == 'HTTP/0.9':
+            handler.wfile.write(self.body)
+            return
+        
+        extra_headers = self._encode_headers()
+        if request_version == 'HTTP/1.0':
+            if not handler.close_connection:
+                extra_headers += _KEEP_ALIVE_HEADER
+        elif handler.close_connection:
+            extra_headers += _CLOSE_HEADER
+        
+        if self.status is HTTPStatus.NOT_MODIFIED:
+            handler.wfile.write(_NOT_MODIFIED_HEAD_TEMPLATE % (
+                _fixed_head(handler, self.status),
+                _http_date(),
+                extra_headers,
+            ))
+            return
+        
+        head = _RESPONSE_HEAD_TEMPLATE % (
+            _fixed_head(handler, self.status),
+            _http_date(),
+            self.content_type.encode('latin-1'),
+            len(self.body),
+            extra_headers,
+        )
+        # 响应头与响应体合并为一次写入（一次 sendall），小响应可在单个 TCP 段内发出
+        if len(self.body) <= _COALESCE_BODY_LIMIT:
+            handler.wfile.write(head + self.body)
+            return
+        
+        # 大响应体：普通 TCP 套接字上用 sendmsg 一次写出两段缓冲区，避免整体复制；
+        # 其他连接类型（如 TLS 包装的套接字）仍分两次写出
+        connection = getattr(handler, 'connection', None)
+        if type(connection) is socket.socket and hasattr(connection, 'sendmsg'):
+            _sendmsg_all(connection, head, self.body)
+        else:
+            handler.wfile.write(head)
+            handler.wfile.write(self.body)
+
+
+_JSON_CONTENT_TYPE = "application/json; charset=utf-8"
 
 
 class JsonResponse(Response):
@@ -67,12 +292,31 @@ class JsonResponse(Response):
         data: Dict[str, Any],
         status: HTTPStatus = HTTPStatus.OK
     ):
-        body = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
         super().__init__(
-            body=body,
+            body=self._dumps(data),
             status=status,
-            content_type="application/json; charset=utf-8"
+            content_type=_JSON_CONTENT_TYPE
         )
+    
+    @staticmethod
+    def _dumps(data: Dict[str, Any]) -> bytes:
+        """序列化为紧凑 JSON 字节（优先 orjson，直接输出 UTF-8 bytes）"""
+        if orjson is not None:
+            try:
+                return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+            except orjson.JSONEncodeError:
+                pass
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+# 固定内容的错误响应体：模块加载时序列化一次，每次请求只创建轻量的 Response 包装
+_ERR_MISSING_CODE_BODY = JsonResponse._dumps(
+    {"success": False, "error": "缺少必填参数: code (股票代码)"}
+)
+_ERR_MISSING_TASK_ID_BODY = JsonResponse._dumps(
+    {"success": False, "error": "缺少必填参数: id (任务ID)"}
+)
+_ERR_BOT_UNAVAILABLE_BODY = JsonResponse._dumps({"error": "Bot module not available"})
 
 
 class HtmlResponse(Response):
@@ -90,22 +334,109 @@ class HtmlResponse(Response):
         )
 
 
+# ============================================================
+# 静态资源
+# ============================================================
+
+# 静态资源 URL 均携带内容哈希版本号，内容永不变化，可长期缓存
+_STATIC_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+class StaticAsset:
+    """
+    预编码的静态资源（CSS/JS）
+    
+    原文与 gzip 压缩版本在创建时一次性生成，请求时只做 ETag 比较与编码协商，
+    不再逐请求编码或压缩
+    """
+    
+    def __init__(self, body: bytes, content_type: str, version: str):
+        self.body = body
+        self.gzip_body = gzip.compress(body, 9)
+        self.content_type = content_type
+        # 不同编码的表示使用不同的强 ETag
+        self.etag = f'"{version}"'
+        self.gzip_etag = f'"{version}-gzip"'
+    
+    def handle(
+        self,
+        query: Dict[str, list],
+        request_handler: 'BaseHTTPRequestHandler'
+    ) -> Response:
+        """
+        处理静态资源请求 GET /static/...
+        
+        Args:
+            query: URL 查询参数（版本号仅用于缓存失效，不参与处理）
+            request_handler: HTTP 请求处理器（读取 Accept-Encoding / If-None-Match 请求头）
+        """
+        headers = request_handler.headers
+        use_gzip = _accepts_gzip(headers.get("Accept-Encoding", ""))
+        etag = self.gzip_etag if use_gzip else self.etag
+        
+        if _etag_matches(headers.get("If-None-Match"), etag):
+            response = Response(b"", status=HTTPStatus.NOT_MODIFIED)
+        elif use_gzip:
+            response = Response(self.gzip_body, content_type=self.content_type)
+            response.add_header("Content-Encoding", "gzip")
+        else:
+            response = Response(self.body, content_type=self.content_type)
+        return (
+            response.add_header("ETag", etag)
+            .add_header("Cache-Control", _STATIC_CACHE_CONTROL)
+            .add_header("Vary", "Accept-Encoding")
+        )
+
+
+BASE_CSS_ASSET = StaticAsset(BASE_CSS_BYTES, "text/css; charset=utf-8", BASE_CSS_VERSION)
+ANALYSIS_JS_ASSET = StaticAsset(ANALYSIS_JS_BYTES, "text/javascript; charset=utf-8", ANALYSIS_JS_VERSION)
+
+
 # ============================================================
 # 页面处理器
 # ============================================================
 
+# 首页 ETag 的进程级密钥：模板随代码发布变化，重启后旧 ETag 全部失效
+_INDEX_ETAG_KEY = os.urandom(16)
+
+
 class PageHandler:
     """页面请求处理器"""
     
     def __init__(self):
         self.config_service = get_config_service()
     
-    def handle_index(self) -> Response:
-        """处理首页请求 GET /"""
+    def handle_index(
+        self,
+        query: Optional[Dict[str, list]] = None,
+        request_handler: Optional['BaseHTTPRequestHandler'] = None
+    ) -> Response:
+        """
+        处理首页请求 GET /
+        
+        首页内容只取决于自选股列表与 .env 文件名：据此计算弱 ETag，
+        与请求的 If-None-Match 一致时直接返回 304，跳过页面渲染
+        
+        Args:
+            query: URL 查询参数（未使用）
+            request_handler: HTTP 请求处理器（读取 If-None-Match 请求头；
+                未传入时不做条件请求判断，始终返回完整页面）
+        """
+        if_none_match = request_handler.headers.get("If-None-Match") if request_handler is not None else None
         stock_list = self.config_service.get_stock_list()
         env_filename = self.config_service.get_env_filename()
-        body = render_config_page(stock_list, env_filename)
-        return HtmlResponse(body)
+        digest = hashlib.blake2b(
+            f"{env_filename}\n{stock_list}".encode("utf-8"),
+            digest_size=8,
+            key=_INDEX_ETAG_KEY
+        ).hexdigest()
+        etag = f'W/"{digest}"'
+        
+        if _etag_matches(if_none_match, etag):
+            response = Response(b"", status=HTTPStatus.NOT_MODIFIED)
+        else:
+            response = HtmlResponse(render_config_page(stock_list, env_filename))
+        return response.add_header("ETag", etag).add_header("Cache-Control", "no-cache")
     
     def handle_update(self, form_data: Dict[str, list]) -> Response:
         """
@@ -114,7 +445,7 @@ class PageHandler:
         Args:
             form_data: 表单数据
         """
-        stock_list = form_data.get("stock_list", [""])[0]
+        stock_list = _first_param(form_data, "stock_list")
         normalized = self.config_service.set_stock_list(stock_list)
         env_filename = self.config_service.get_env_filename()
         body = render_config_page(normalized, env_filename, message="已保存")
@@ -130,10 +461,15 @@ class ApiHandler:
     
     def __init__(self):
         self.analysis_service = get_analysis_service()
+        # 健康检查响应体缓存：(秒级时间戳, 已序列化的 JSON)，同一秒内的探测复用
+        self._health_cache: Tuple[int, bytes] = (0, b"")
+        # 已结束任务的状态响应体缓存：{task_id: 已序列化的 JSON}，前端轮询时免去重复序列化
+        self._task_body_cache: 'OrderedDict[str, bytes]' = OrderedDict()
+        self._task_body_lock = threading.Lock()
     
-    def handle_health(self) -> Response:
+    def handle_health(self, query: Optional[Dict[str, list]] = None) -> Response:
         """
-        健康检查 GET /health
+        健康检查 GET /health（查询参数未使用）
         
         返回:
             {
@@ -142,12 +478,17 @@ class ApiHandler:
                 "service": "stock-analysis-webui"
             }
         """
-        data = {
-            "status": "ok",
-            "timestamp": datetime.now().isoformat(),
-            "service": "stock-analysis-webui"
-        }
-        return JsonResponse(data)
+        now = int(time.time())
+        cached_at, body = self._health_cache
+        if cached_at != now:
+            data = {
+                "status": "ok",
+                "timestamp": datetime.fromtimestamp(now).isoformat(),
+                "service": "stock-analysis-webui"
+            }
+            body = JsonResponse._dumps(data)
+            self._health_cache = (now, body)
+        return Response(body, content_type=_JSON_CONTENT_TYPE)
     
     def handle_analysis(self, query: Dict[str, list]) -> Response:
         """
@@ -165,35 +506,29 @@ class ApiHandler:
             }
         """
         # 获取股票代码参数
-        code_list = query.get("code", [])
-        if not code_list or not code_list[0].strip():
-            return JsonResponse(
-                {"success": False, "error": "缺少必填参数: code (股票代码)"},
-                status=HTTPStatus.BAD_REQUEST
+        code = _first_param(query, "code")
+        if not code:
+            return Response(
+                _ERR_MISSING_CODE_BODY,
+                status=HTTPStatus.BAD_REQUEST,
+                content_type=_JSON_CONTENT_TYPE
             )
-        
-        code = code_list[0].strip()
 
         # 验证股票代码格式：A股(6位数字) / 港股(HK+5位数字) / 美股(1-5个大写字母+.+2个后缀字母)
         code = code.upper()
-        is_a_stock = re.match(r'^\d{6}$', code)
-        is_hk_stock = re.match(r'^HK\d{5}$', code)
-        is_us_stock = re.match(r'^[A-Z]{1,5}(\.[A-Z]{1,2})?$', code.upper())
-
-        if not (is_a_stock or is_hk_stock or is_us_stock):
+        if not _is_valid_stock_code(code):
             return JsonResponse(
                 {"success": False, "error": f"无效的股票代码格式: {code} (A股6位数字 / 港股HK+5位数字 / 美股1-5个字母)"},
                 status=HTTPStatus.BAD_REQUEST
             )
         
         # 获取报告类型参数（默认精简报告）
-        report_type_str = query.get("report_type", ["simple"])[0]
-        report_type = ReportType.from_str(report_type_str)
+        report_type = ReportType.from_str(_first_param(query, "report_type", "simple"))
         
         # 是否保存上下文快照（可选，默认读取配置）
         save_snapshot = None
         if "save_context_snapshot" in query:
-            save_snapshot = self._parse_bool(query.get("save_context_snapshot", [""])[0])
+            save_snapshot = self._parse_bool(_first_param(query, "save_context_snapshot"))
 
         # 提交异步分析任务
         try:
@@ -217,18 +552,11 @@ class ApiHandler:
         Args:
             query: URL 查询参数 (code, query_id, days, limit)
         """
-        code = query.get("code", [""])[0].strip() or None
-        query_id = query.get("query_id", [""])[0].strip() or None
-
-        try:
-            days = int(query.get("days", ["30"])[0])
-        except ValueError:
-            days = 30
+        code = _first_param(query, "code") or None
+        query_id = _first_param(query, "query_id") or None
 
-        try:
-            limit = int(query.get("limit", ["50"])[0])
-        except ValueError:
-            limit = 50
+        days = self._parse_int(query.get("days"), 30)
+        limit = self._parse_int(query.get("limit"), 50)
 
         history = self.analysis_service.get_analysis_history(
             code=code,
@@ -249,11 +577,21 @@ class ApiHandler:
         解析布尔参数
         """
         text = (value or "").strip().lower()
-        if text in {"1", "true", "yes", "y", "on"}:
+        if text in _TRUTHY_VALUES:
             return True
-        if text in {"0", "false", "no", "n", "off"}:
+        if text in _FALSY_VALUES:
             return False
         return None
+
+    @staticmethod
+    def _parse_int(values: Optional[list], default: int) -> int:
+        """
+        解析非负整数参数，缺失或非法时返回默认值
+
+        先用 isdecimal 校验，非法输入不经过 int() 的异常路径
+        """
+        text = values[0].strip() if values else ""
+        return int(text) if text.isdecimal() else default
     
     def handle_tasks(self, query: Dict[str, list]) -> Response:
         """
@@ -268,11 +606,7 @@ class ApiHandler:
                 "tasks": [...]
             }
         """
-        limit_list = query.get("limit", ["20"])
-        try:
-            limit = int(limit_list[0])
-        except ValueError:
-            limit = 20
+        limit = self._parse_int(query.get("limit"), 20)
         
         tasks = self.analysis_service.list_tasks(limit=limit)
         return JsonResponse({"success": True, "tasks": tasks})
@@ -284,14 +618,18 @@ class ApiHandler:
         Args:
             query: URL 查询参数
         """
-        task_id_list = query.get("id", [])
-        if not task_id_list or not task_id_list[0].strip():
-            return JsonResponse(
-                {"success": False, "error": "缺少必填参数: id (任务ID)"},
-                status=HTTPStatus.BAD_REQUEST
+        task_id = _first_param(query, "id")
+        if not task_id:
+            return Response(
+                _ERR_MISSING_TASK_ID_BODY,
+                status=HTTPStatus.BAD_REQUEST,
+                content_type=_JSON_CONTENT_TYPE
             )
         
-        task_id = task_id_list[0].strip()
+        body = self._task_body_cache.get(task_id)
+        if body is not None:
+            return Response(body, content_type=_JSON_CONTENT_TYPE)
+        
         task = self.analysis_service.get_task_status(task_id)
         
         if task is None:
@@ -300,7 +638,16 @@ class ApiHandler:
                 status=HTTPStatus.NOT_FOUND
             )
         
-        return JsonResponse({"success": True, "task": task})
+        # 先读状态再序列化：task 为快照，状态与响应体保持一致
+        status = task.get("status")
+        body = JsonResponse._dumps({"success": True, "task": task})
+        # 仅缓存已结束的任务：运行中的任务状态仍会变化
+        if status in _TERMINAL_TASK_STATUSES:
+            with self._task_body_lock:
+                self._task_body_cache[task_id] = body
+                if len(self._task_body_cache) > _TASK_BODY_CACHE_SIZE:
+                    self._task_body_cache.popitem(last=False)
+        return Response(body, content_type=_JSON_CONTENT_TYPE)
 
 
 # ============================================================
@@ -314,25 +661,41 @@ class BotHandler:
     处理各平台的机器人回调请求。
     """
     
-    def handle_webhook(self, platform: str, form_data: Dict[str, list], headers: Dict[str, str], body: bytes) -> Response:
+    def __init__(self):
+        # bot 模块依赖较重，在首次收到 Webhook 时（处理器创建时）解析一次并缓存入口函数，
+        # 避免每个请求都重复执行 import 语句
+        try:
+            from bot.handler import handle_webhook
+            self._handle_webhook = handle_webhook
+            self._import_error: Optional[ImportError] = None
+        except ImportError as e:
+            self._handle_webhook = None
+            self._import_error = e
+    
+    def handle_webhook(self, platform: str, form_data: Dict[str, list], headers: Mapping[str, str], body: bytes) -> Response:
         """
         处理 Webhook 请求
         
         Args:
             platform: 平台名称 (feishu, dingtalk, wecom, telegram)
             form_data: POST 数据（已解析）
-            headers: HTTP 请求头
+            headers: HTTP 请求头（只读映射，无需复制为 dict）
             body: 原始请求体
             
         Returns:
             Response 对象
         """
+        if self._handle_webhook is None:
+            logger.error(f"[BotHandler] Bot 模块未正确安装: {self._import_error}")
+            return Response(
+                _ERR_BOT_UNAVAILABLE_BODY,
+                status=HTTPStatus.INTERNAL_SERVER_ERROR,
+                content_type=_JSON_CONTENT_TYPE
+            )
+        
         try:
-            from bot.handler import handle_webhook
-            from bot.models import WebhookResponse
-            
             # 调用 bot 模块处理
-            webhook_response = handle_webhook(platform, headers, body)
+            webhook_response = self._handle_webhook(platform, headers, body)
             
             # 转换为 web 响应
             return JsonResponse(
@@ -340,12 +703,6 @@ class BotHandler:
                 status=HTTPStatus(webhook_response.status_code)
             )
             
-        except ImportError as e:
-            logger.error(f"[BotHandler] Bot 模块未正确安装: {e}")
-            return JsonResponse(
-                {"error": "Bot module not available"},
-                status=HTTPStatus.INTERNAL_SERVER_ERROR
-            )
         except Exception as e:
             logger.error(f"[BotHandler] 处理 {platform} Webhook 失败: {e}")
             return JsonResponse(
@@ -361,13 +718,17 @@ class BotHandler:
 _page_handler: PageHandler | None = None
 _api_handler: ApiHandler | None = None
 _bot_handler: BotHandler | None = None
+# 仅在首次创建时加锁；创建完成后读取全局变量无需加锁
+_handler_lock = threading.Lock()
 
 
 def get_page_handler() -> PageHandler:
     """获取页面处理器实例"""
     global _page_handler
     if _page_handler is None:
-        _page_handler = PageHandler()
+        with _handler_lock:
+            if _page_handler is None:
+                _page_handler = PageHandler()
     return _page_handler
 
 
@@ -375,7 +736,9 @@ def get_api_handler() -> ApiHandler:
     """获取 API 处理器实例"""
     global _api_handler
     if _api_handler is None:
-        _api_handler = ApiHandler()
+        with _handler_lock:
+            if _api_handler is None:
+                _api_handler = ApiHandler()
     return _api_handler
 
 
@@ -383,5 +746,7 @@ def get_bot_handler() -> BotHandler:
     """获取 Bot 处理器实例"""
     global _bot_handler
     if _bot_handler is None:
-        _bot_handler = BotHandler()
+        with _handler_lock:
+            if _bot_handler is None:
+                _bot_handler = BotHandler()
     return _bot_handler
@@ -13,12 +13,14 @@ Web 路由层 - 请求分发
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 from http import HTTPStatus
-from typing import Callable, Dict, List, Optional, TYPE_CHECKING, Tuple
+from typing import Callable, Dict, Optional, TYPE_CHECKING, Tuple
 from urllib.parse import parse_qs, urlparse
 
 from web.handlers import (
-    Response, HtmlResponse, JsonResponse,
+    Response, HtmlResponse, JsonResponse, _JSON_CONTENT_TYPE,
+    BASE_CSS_ASSET, ANALYSIS_JS_ASSET,
     get_page_handler, get_api_handler, get_bot_handler
 )
 from web.templates import render_error_page
@@ -28,13 +30,52 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Bot Webhook 路径前缀：/bot/<platform>
+_BOT_WEBHOOK_PREFIX = "/bot/"
+
+# 超过该长度的查询串不进入解析缓存，避免少量长查询挤占前端轮询的缓存条目
+_QUERY_CACHE_MAX_LEN = 512
+
+
+@lru_cache(maxsize=1024)
+def _parse_query_cached(query_string: str) -> Dict[str, Tuple[str, ...]]:
+    """解析查询串（结果只取决于查询串本身；值转为元组，缓存共享时不会被修改）"""
+    return {key: tuple(values) for key, values in parse_qs(query_string).items()}
+
+
+def _parse_query(query_string: str) -> Dict[str, Tuple[str, ...]]:
+    """
+    解析 GET 查询参数
+    
+    前端轮询 /task、/tasks 时查询串高度重复，命中缓存只需一次哈希查找；
+    每次返回浅拷贝，处理函数对字典本身的修改不会影响缓存
+    """
+    if len(query_string) > _QUERY_CACHE_MAX_LEN:
+        return {key: tuple(values) for key, values in parse_qs(query_string).items()}
+    return dict(_parse_query_cached(query_string))
+
+
+def _declared_body_length(request_handler: 'BaseHTTPRequestHandler') -> Optional[int]:
+    """
+    返回请求声明的请求体长度（缺省为 0）
+    
+    分块传输（Transfer-Encoding）或非法的 Content-Length 无法确定请求体边界，返回 None；
+    长连接上未按边界读完的字节会被当作下一个请求解析
+    """
+    headers = request_handler.headers
+    if "Transfer-Encoding" in headers:
+        return None
+    content_length = headers.get("Content-Length", "0").strip() or "0"
+    return int(content_length) if content_length.isdecimal() else None
+
 
 # ============================================================
 # 路由定义
 # ============================================================
 
 # 路由处理函数类型: (query_params) -> Response
-RouteHandler = Callable[[Dict[str, list]], Response]
+# 注册时声明 pass_request=True 的路由额外接收请求处理器: (query_params, request_handler) -> Response
+RouteHandler = Callable[..., Response]
 
 
 class Route:
@@ -45,12 +86,20 @@ class Route:
         path: str,
         method: str,
         handler: RouteHandler,
-        description: str = ""
+        description: str = "",
+        pass_request: bool = False
     ):
         self.path = path
         self.method = method.upper()
         self.handler = handler
         self.description = description
+        self.pass_request = pass_request
+    
+    def invoke(self, params: Dict[str, list], request_handler: 'BaseHTTPRequestHandler') -> Response:
+        """调用处理函数（按需传入请求处理器，如读取条件请求头）"""
+        if self.pass_request:
+            return self.handler(params, request_handler)
+        return self.handler(params)
 
 
 class Router:
@@ -64,14 +113,20 @@ class Router:
     """
     
     def __init__(self):
-        self._routes: Dict[str, Dict[str, Route]] = {}  # {path: {method: Route}}
+        self._routes: Dict[Tuple[str, str], Route] = {}  # {(method, path): Route}
+        # 路径 -> 已注册方法，未命中路由时据此区分 404 与 405
+        self._allowed_methods: Dict[str, Tuple[str, ...]] = {}
+        # list_routes 结果缓存（不可变元组），注册新路由时失效
+        self._routes_snapshot: Optional[Tuple[Tuple[str, str, str], ...]] = None
+        self._routes_pretty: Optional[str] = None
     
     def register(
         self,
         path: str,
         method: str,
         handler: RouteHandler,
-        description: str = ""
+        description: str = "",
+        pass_request: bool = False
     ) -> None:
         """
         注册路由
@@ -81,12 +136,16 @@ class Router:
             method: HTTP 方法 (GET, POST, etc.)
             handler: 处理函数
             description: 路由描述
+            pass_request: 是否向处理函数额外传入请求处理器
         """
         method = method.upper()
-        if path not in self._routes:
-            self._routes[path] = {}
         
-        self._routes[path][method] = Route(path, method, handler, description)
+        self._routes[(method, path)] = Route(path, method, handler, description, pass_request)
+        allowed = self._allowed_methods.get(path, ())
+        if method not in allowed:
+            self._allowed_methods[path] = allowed + (method,)
+        self._routes_snapshot = None
+        self._routes_pretty = None
         logger.debug(f"[Router] 注册路由: {method} {path}")
     
     def get(self, path: str, description: str = "") -> Callable:
@@ -114,13 +173,7 @@ class Router:
         Returns:
             匹配的路由，或 None
         """
-        method = method.upper()
-        routes_for_path = self._routes.get(path)
-        
-        if routes_for_path is None:
-            return None
-        
-        return routes_for_path.get(method)
+        return self._routes.get((method.upper(), path))
     
     def dispatch(
         self,
@@ -134,10 +187,14 @@ class Router:
             request_handler: HTTP 请求处理器
             method: HTTP 方法
         """
+        # GET 路由不读取请求体：携带请求体（或无法确定其边界）时，
+        # 剩余字节会被当作下一个请求解析，响应后关闭连接
+        if _declared_body_length(request_handler) != 0:
+            request_handler.close_connection = True
+        
         # 解析 URL
         parsed = urlparse(request_handler.path)
         path = parsed.path
-        query = parse_qs(parsed.query)
         
         # 处理根路径
         if path == "":
@@ -147,13 +204,15 @@ class Router:
         route = self.match(path, method)
         
         if route is None:
-            # 404 Not Found
-            self._send_not_found(request_handler, path)
+            self._send_unmatched(request_handler, path)
             return
         
+        # 命中路由后才解析查询参数
+        query = _parse_query(parsed.query)
+        
         try:
             # 调用处理器
-            response = route.handler(query)
+            response = route.invoke(query, request_handler)
             response.send(request_handler)
             
         except Exception as e:
@@ -173,29 +232,35 @@ class Router:
         parsed = urlparse(request_handler.path)
         path = parsed.path
         
+        # 仅支持以 Content-Length 分帧的请求体：无法确定边界时直接拒绝并关闭连接
+        content_length = _declared_body_length(request_handler)
+        if content_length is None:
+            self._send_length_required(request_handler)
+            return
+        
         # 读取 POST body（保留原始字节用于 Bot Webhook）
-        content_length = int(request_handler.headers.get("Content-Length", "0") or "0")
         raw_body_bytes = request_handler.rfile.read(content_length)
-        raw_body = raw_body_bytes.decode("utf-8", errors="replace")
         
-        # 检查是否是 Bot Webhook 路由
-        if path.startswith("/bot/"):
-            self._dispatch_bot_webhook(request_handler, path, raw_body_bytes)
+        # 检查是否是 Bot Webhook 路由（直接使用原始字节，无需解码）
+        if path.startswith(_BOT_WEBHOOK_PREFIX):
+            # 提取平台名称：/bot/feishu -> feishu（前缀已确认，单次 partition 即可取出）
+            platform = path[len(_BOT_WEBHOOK_PREFIX):].partition('/')[0]
+            self._dispatch_bot_webhook(request_handler, path, platform, raw_body_bytes)
             return
         
-        # 普通 POST 请求
-        form_data = parse_qs(raw_body)
-        
         # 匹配路由
         route = self.match(path, "POST")
         
         if route is None:
-            self._send_not_found(request_handler, path)
+            self._send_unmatched(request_handler, path)
             return
         
+        # 普通 POST 请求：仅在命中路由后才解码并解析表单
+        form_data = parse_qs(raw_body_bytes.decode("utf-8", errors="replace"))
+        
         try:
             # 调用处理器（传入 form_data）
-            response = route.handler(form_data)
+            response = route.invoke(form_data, request_handler)
             response.send(request_handler)
             
         except Exception as e:
@@ -206,6 +271,7 @@ class Router:
         self,
         request_handler: 'BaseHTTPRequestHandler',
         path: str,
+        platform: str,
         body: bytes
     ) -> None:
         """
@@ -216,40 +282,71 @@ class Router:
         Args:
             request_handler: HTTP 请求处理器
             path: 请求路径
+            platform: 平台名称（由路径 /bot/<platform> 提取）
             body: 原始请求体字节
         """
-        # 提取平台名称：/bot/feishu -> feishu
-        parts = path.strip('/').split('/')
-        if len(parts) < 2:
+        if not platform:
             self._send_not_found(request_handler, path)
             return
         
-        platform = parts[1]
-        
-        # 获取请求头
-        headers = {key: value for key, value in request_handler.headers.items()}
-        
         try:
+            # 直接传入 HTTPMessage：平台校验只通过 .get 读取请求头，无需逐请求复制为 dict
             bot_handler = get_bot_handler()
-            response = bot_handler.handle_webhook(platform, {}, headers, body)
+            response = bot_handler.handle_webhook(platform, {}, request_handler.headers, body)
             response.send(request_handler)
             
         except Exception as e:
             logger.error(f"[Router] 处理 Bot Webhook 失败: {path} - {e}")
             self._send_error(request_handler, str(e))
     
-    def list_routes(self) -> List[Tuple[str, str, str]]:
+    def list_routes(self) -> Tuple[Tuple[str, str, str], ...]:
         """
-        列出所有路由
+        列出所有路由（按路径、方法排序，结果缓存至下次注册路由）
         
         Returns:
-            [(method, path, description), ...]
+            ((method, path, description), ...)
         """
-        routes = []
-        for path, methods in self._routes.items():
-            for method, route in methods.items():
-                routes.append((method, path, route.description))
-        return sorted(routes, key=lambda x: (x[1], x[0]))
+        if self._routes_snapshot is None:
+            self._routes_snapshot = tuple(sorted(
+                ((method, path, route.description) for (method, path), route in self._routes.items()),
+                key=lambda x: (x[1], x[0])
+            ))
+        return self._routes_snapshot
+    
+    def format_routes(self) -> str:
+        """路由列表的多行文本（用于启动日志，结果与 list_routes 同步缓存）"""
+        if self._routes_pretty is None:
+            self._routes_pretty = "\n".join(
+                f"  {method:6} {path:20} - {desc}"
+                for method, path, desc in self.list_routes()
+            )
+        return self._routes_pretty
+    
+    def _send_unmatched(
+        self,
+        request_handler: 'BaseHTTPRequestHandler',
+        path: str
+    ) -> None:
+        """未命中路由：路径已注册但方法不符时返回 405，否则返回 404"""
+        allowed = self._allowed_methods.get(path)
+        if allowed is None:
+            self._send_not_found(request_handler, path)
+            return
+        
+        body = render_error_page(405, "方法不允许", f"路径 {path} 仅支持 {', '.join(allowed)} 请求")
+        response = HtmlResponse(body, status=HTTPStatus.METHOD_NOT_ALLOWED)
+        response.add_header("Allow", ", ".join(allowed))
+        response.send(request_handler)
+    
+    def _send_length_required(
+        self,
+        request_handler: 'BaseHTTPRequestHandler'
+    ) -> None:
+        """发送 411 响应并关闭连接（请求体未读取，连接上的剩余字节不可再解析）"""
+        request_handler.close_connection = True
+        body = render_error_page(411, "缺少请求长度", "POST 请求须携带有效的 Content-Length，不支持分块传输")
+        response = HtmlResponse(body, status=HTTPStatus.LENGTH_REQUIRED)
+        response.send(request_handler)
     
     def _send_not_found(
         self,
@@ -276,6 +373,15 @@ class Router:
 # 默认路由注册
 # ============================================================
 
+# 占位响应体：模块加载时序列化一次
+_BOT_WEBHOOK_STUB_BODY = JsonResponse._dumps({"error": "Use POST with JSON body"})
+
+
+def _bot_webhook_stub(form: Dict[str, list]) -> Response:
+    """Bot Webhook 占位处理函数（实际请求由 _dispatch_bot_webhook 处理，仅用于路由列表展示）"""
+    return Response(_BOT_WEBHOOK_STUB_BODY, content_type=_JSON_CONTENT_TYPE)
+
+
 def create_default_router() -> Router:
     """创建并配置默认路由"""
     router = Router()
@@ -287,44 +393,60 @@ def create_default_router() -> Router:
     # === 页面路由 ===
     router.register(
         "/", "GET",
-        lambda q: page_handler.handle_index(),
-        "配置首页"
+        page_handler.handle_index,
+        "配置首页",
+        pass_request=True
     )
     
     router.register(
         "/update", "POST",
-        lambda form: page_handler.handle_update(form),
+        page_handler.handle_update,
         "更新配置"
     )
     
+    # === 静态资源路由 ===
+    router.register(
+        "/static/base.css", "GET",
+        BASE_CSS_ASSET.handle,
+        "基础样式",
+        pass_request=True
+    )
+    
+    router.register(
+        "/static/analysis.js", "GET",
+        ANALYSIS_JS_ASSET.handle,
+        "分析组件脚本",
+        pass_request=True
+    )
+    
     # === API 路由 ===
     router.register(
         "/health", "GET",
-        lambda q: api_handler.handle_health(),
+        api_handler.handle_health,
         "健康检查"
     )
     
     router.register(
         "/analysis", "GET",
-        lambda q: api_handler.handle_analysis(q),
+        api_handler.handle_analysis,
         "触发股票分析"
     )
 
     router.register(
         "/analysis/history", "GET",
-        lambda q: api_handler.handle_analysis_history(q),
+        api_handler.handle_analysis_history,
         "查询分析历史"
     )
     
     router.register(
         "/tasks", "GET",
-        lambda q: api_handler.handle_tasks(q),
+        api_handler.handle_tasks,
         "查询任务列表"
     )
     
     router.register(
         "/task", "GET",
-        lambda q: api_handler.handle_task_status(q),
+        api_handler.handle_task_status,
         "查询任务状态"
     )
     
@@ -336,28 +458,28 @@ def create_default_router() -> Router:
     # 飞书机器人 Webhook
     router.register(
         "/bot/feishu", "POST",
-        lambda form: JsonResponse({"error": "Use POST with JSON body"}),
+        _bot_webhook_stub,
         "飞书机器人 Webhook"
     )
     
     # 钉钉机器人 Webhook
     router.register(
         "/bot/dingtalk", "POST",
-        lambda form: JsonResponse({"error": "Use POST with JSON body"}),
+        _bot_webhook_stub,
         "钉钉机器人 Webhook"
     )
     
     # 企业微信机器人 Webhook（开发中）
     # router.register(
     #     "/bot/wecom", "POST",
-    #     lambda form: JsonResponse({"error": "Use POST with JSON body"}),
+    #     _bot_webhook_stub,
     #     "企业微信机器人 Webhook"
     # )
     
     # Telegram 机器人 Webhook（开发中）
     # router.register(
     #     "/bot/telegram", "POST",
-    #     lambda form: JsonResponse({"error": "Use POST with JSON body"}),
+    #     _bot_webhook_stub,
     #     "Telegram 机器人 Webhook"
     # )
     
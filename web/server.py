@@ -31,8 +31,17 @@ class WebRequestHandler(BaseHTTPRequestHandler):
     HTTP 请求处理器
     
     将请求分发到路由器处理
+    
+    使用 HTTP/1.1 长连接：前端轮询 /task 时复用同一 TCP 连接，
+    省去每次请求的建连开销（所有响应均带 Content-Length，可正确分帧）
     """
     
+    protocol_version = "HTTP/1.1"
+    # 空闲连接超时（秒）：长连接各占一个线程，超时后关闭以释放线程
+    timeout = 30
+    # 长连接上禁用 Nagle 算法（TCP_NODELAY），避免分段写出的响应与延迟 ACK 叠加产生等待
+    disable_nagle_algorithm = True
+    
     # 类级别的路由器引用
     router: Router = None  # type: ignore
     
@@ -55,6 +64,17 @@ class WebRequestHandler(BaseHTTPRequestHandler):
 # Web 服务器
 # ============================================================
 
+class WebHTTPServer(ThreadingHTTPServer):
+    """
+    WebUI 使用的 HTTP 服务器
+    
+    长连接下每个连接占用一个线程直至空闲超时，仍保持每连接一线程模型
+    （固定大小线程池会被空闲长连接占满）；仅调大监听队列，应对突发建连
+    """
+    
+    request_queue_size = 128
+
+
 class WebServer:
     """
     Web 服务器
@@ -87,6 +107,8 @@ class WebServer:
         """
         self.host = host
         self.port = port
+        # 未指定路由器时使用全局默认路由，可直接绑定到 WebRequestHandler
+        self._uses_default_router = router is None
         self.router = router or get_router()
         
         self._server: Optional[ThreadingHTTPServer] = None
@@ -98,8 +120,16 @@ class WebServer:
         return f"http://{self.host}:{self.port}"
     
     def _create_handler_class(self) -> Type[WebRequestHandler]:
-        """创建带路由器引用的处理器类"""
+        """
+        创建带路由器引用的处理器类
+        
+        默认全局路由直接绑定到 WebRequestHandler（重复启动不会累积新类）；
+        仅自定义路由器时派生子类，使多个服务器实例互不影响
+        """
         router = self.router
+        if self._uses_default_router:
+            WebRequestHandler.router = router
+            return WebRequestHandler
         
         class Handler(WebRequestHandler):
             pass
@@ -110,7 +140,7 @@ class WebServer:
     def _create_server(self) -> ThreadingHTTPServer:
         """创建 HTTP 服务器实例"""
         handler_class = self._create_handler_class()
-        return ThreadingHTTPServer((self.host, self.port), handler_class)
+        return WebHTTPServer((self.host, self.port), handler_class)
     
     def run(self) -> None:
         """
@@ -124,11 +154,9 @@ class WebServer:
         print(f"WebUI 服务启动: {self.address}")
         
         # 打印路由列表
-        routes = self.router.list_routes()
+        routes = self.router.format_routes()
         if routes:
-            logger.info("已注册路由:")
-            for method, path, desc in routes:
-                logger.info(f"  {method:6} {path:20} - {desc}")
+            logger.info("已注册路由:\n%s", routes)
         
         try:
             self._server.serve_forever()
@@ -17,7 +17,7 @@ import logging
 import threading
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, Dict, Any, List, Union
+from typing import Optional, Dict, Any, List, Tuple, Union
 
 from src.enums import ReportType
 from src.storage import get_db
@@ -35,6 +35,9 @@ _STOCK_LIST_RE = re.compile(
     r"^(?P<prefix>\s*STOCK_LIST\s*=\s*)(?P<value>.*?)(?P<suffix>\s*)$"
 )
 
+# 股票列表分隔符统一转换为逗号（换行、回车、制表符、分号），单次 C 层 translate 完成
+_STOCK_SEPARATOR_TABLE = str.maketrans({"\n": ",", "\r": ",", "\t": ",", ";": ","})
+
 
 class ConfigService:
     """
@@ -45,6 +48,9 @@ class ConfigService:
     
     def __init__(self, env_path: Optional[str] = None):
         self.env_path = env_path or _ENV_PATH
+        self._env_filename = os.path.basename(self.env_path)
+        # STOCK_LIST 缓存：((mtime_ns, size), 值)，.env 未变化时免去整文件读取与逐行匹配
+        self._stock_list_cache: Optional[Tuple[Tuple[int, int], str]] = None
     
     def read_env_text(self) -> str:
         """读取 .env 文件内容"""
@@ -60,9 +66,21 @@ class ConfigService:
             f.write(text)
     
     def get_stock_list(self) -> str:
-        """获取当前自选股列表字符串"""
-        env_text = self.read_env_text()
-        return self._extract_stock_list(env_text)
+        """获取当前自选股列表字符串（.env 文件未修改时直接返回缓存）"""
+        try:
+            st = os.stat(self.env_path)
+        except FileNotFoundError:
+            self._stock_list_cache = None
+            return ""
+        signature = (st.st_mtime_ns, st.st_size)
+        
+        cached = self._stock_list_cache
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        
+        stock_list = self._extract_stock_list(self.read_env_text())
+        self._stock_list_cache = (signature, stock_list)
+        return stock_list
     
     def set_stock_list(self, stock_list: str) -> str:
         """
@@ -78,11 +96,12 @@ class ConfigService:
         normalized = self._normalize_stock_list(stock_list)
         updated = self._update_stock_list(env_text, normalized)
         self.write_env_text(updated)
+        self._stock_list_cache = None
         return normalized
     
     def get_env_filename(self) -> str:
         """获取 .env 文件名"""
-        return os.path.basename(self.env_path)
+        return self._env_filename
     
     def _extract_stock_list(self, env_text: str) -> str:
         """从环境文件中提取 STOCK_LIST 值"""
@@ -99,9 +118,8 @@ class ConfigService:
     
     def _normalize_stock_list(self, value: str) -> str:
         """规范化股票列表格式"""
-        parts = [p.strip() for p in value.replace("\n", ",").split(",")]
-        parts = [p for p in parts if p]
-        return ",".join(parts)
+        parts = value.translate(_STOCK_SEPARATOR_TABLE).split(",")
+        return ",".join(filter(None, (p.strip() for p in parts)))
     
     def _update_stock_list(self, env_text: str, new_value: str) -> str:
         """更新环境文件中的 STOCK_LIST"""
@@ -214,9 +232,10 @@ class AnalysisService:
         }
     
     def get_task_status(self, task_id: str) -> Optional[Dict[str, Any]]:
-        """获取任务状态"""
+        """获取任务状态（返回加锁拷贝的快照，避免与分析线程的更新交错）"""
         with self._tasks_lock:
-            return self._tasks.get(task_id)
+            task = self._tasks.get(task_id)
+            return dict(task) if task is not None else None
     
     def list_tasks(self, limit: int = 20) -> List[Dict[str, Any]]:
         """列出最近的任务"""
@@ -12,6 +12,7 @@ Web 模板层 - HTML 页面生成
 
 from __future__ import annotations
 
+import hashlib
 import html
 from typing import Optional
 
@@ -549,6 +550,12 @@ button:active {
 }
 """
 
+# BASE_CSS 作为独立静态资源 /static/base.css 提供，页面仅通过 <link> 引用：
+# 模块加载时编码一次，URL 携带内容哈希作为版本号，样式变更后浏览器自动拉取新版本
+BASE_CSS_BYTES = BASE_CSS.encode("utf-8")
+BASE_CSS_VERSION = hashlib.sha1(BASE_CSS_BYTES).hexdigest()[:10]
+BASE_CSS_URL = f"/static/base.css?v={BASE_CSS_VERSION}"
+
 
 # ============================================================
 # 页面模板
@@ -575,7 +582,8 @@ def render_base(
   <meta charset="utf-8" />
   <meta name="viewport" content="width=device-width, initial-scale=1" />
   <title>{html.escape(title)}</title>
-  <style>{BASE_CSS}{extra_css}</style>
+  <link rel="stylesheet" href="{BASE_CSS_URL}" />
+  <style>{extra_css}</style>
 </head>
 <body>
   {content}
@@ -612,26 +620,8 @@ def render_toast(message: str, toast_type: str = "success") -> str:
     """
 
 
-def render_config_page(
-    stock_list: str,
-    env_filename: str,
-    message: Optional[str] = None
-) -> bytes:
-    """
-    渲染配置页面
-    
-    Args:
-        stock_list: 当前自选股列表
-        env_filename: 环境文件名
-        message: 可选的提示消息
-    """
-    safe_value = html.escape(stock_list)
-    toast_html = render_toast(message) if message else ""
-    
-    # 分析组件的 JavaScript - 支持多任务
-    analysis_js = """
-<script>
-(function() {
+# 分析组件的 JavaScript - 支持多任务
+ANALYSIS_JS = """(function() {
     const codeInput = document.getElementById('analysis_code');
     const submitBtn = document.getElementById('analysis_btn');
     const taskList = document.getElementById('task_list');
@@ -911,10 +901,15 @@ def render_config_page(
     updateButtonState();
     renderAllTasks();
 })();
-</script>
 """
-    
-    content = f"""
+
+# 与 BASE_CSS 相同，作为独立静态资源 /static/analysis.js 提供，URL 携带内容哈希版本号
+ANALYSIS_JS_BYTES = ANALYSIS_JS.encode("utf-8")
+ANALYSIS_JS_VERSION = hashlib.sha1(ANALYSIS_JS_BYTES).hexdigest()[:10]
+ANALYSIS_JS_URL = f"/static/analysis.js?v={ANALYSIS_JS_VERSION}"
+
+# 配置页面主体：.env 文件名、自选股列表、提示消息三处随请求变化，以 \0 占位
+_CONFIG_PAGE_CONTENT = f"""
   <div class="container">
     <h2>📈 A股/港股/美股分析</h2>
     
@@ -948,14 +943,14 @@ def render_config_page(
     <!-- 自选股配置区域 -->
     <form method="post" action="/update">
       <div class="form-group">
-        <label for="stock_list">📋 自选股列表 <span class="code-badge">{html.escape(env_filename)}</span></label>
+        <label for="stock_list">📋 自选股列表 <span class="code-badge">\0</span></label>
         <p>仅用于本地环境 (127.0.0.1) • 安全修改 .env 配置</p>
         <textarea 
             id="stock_list" 
             name="stock_list" 
             rows="4" 
             placeholder="例如: 600519, 000001 (逗号或换行分隔)"
-        >{safe_value}</textarea>
+        >\0</textarea>
       </div>
       <button type="submit">💾 保存</button>
     </form>
@@ -965,15 +960,53 @@ def render_config_page(
     </div>
   </div>
   
-  {toast_html}
-  {analysis_js}
+  \0
+  <script src="{ANALYSIS_JS_URL}"></script>
 """
-    
-    page = render_base(
+
+# 配置页面骨架只在模块加载时渲染并编码一次，按占位切分为静态字节片段；
+# 请求时仅转义、编码三处变量并拼接，不再逐次重建整页 f-string 或编码整页
+_CONFIG_PAGE_PARTS = tuple(
+    part.encode("utf-8")
+    for part in render_base(
         title="A/H股自选配置 | WebUI",
-        content=content
-    )
-    return page.encode("utf-8")
+        content=_CONFIG_PAGE_CONTENT
+    ).split("\0")
+)
+
+
+def render_config_page(
+    stock_list: str,
+    env_filename: str,
+    message: Optional[str] = None
+) -> bytes:
+    """
+    渲染配置页面
+    
+    Args:
+        stock_list: 当前自选股列表
+        env_filename: 环境文件名
+        message: 可选的提示消息
+    """
+    head, after_filename, after_stock_list, tail = _CONFIG_PAGE_PARTS
+    toast_html = render_toast(message) if message else ""
+    
+    return b"".join((
+        head,
+        html.escape(env_filename).encode("utf-8"),
+        after_filename,
+        html.escape(stock_list).encode("utf-8"),
+        after_stock_list,
+        toast_html.encode("utf-8"),
+        tail,
+    ))
+
+
+# 错误页面骨架与请求无关，模块加载时渲染并编码一次，
+# 按标题、内容两处占位切分为三段静态字节
+_ERROR_PAGE_HEAD, _ERROR_PAGE_MID, _ERROR_PAGE_TAIL = (
+    render_base(title="\0", content="\0").encode("utf-8").split(b"\0")
+)
 
 
 def render_error_page(
@@ -1000,8 +1033,10 @@ def render_error_page(
   </div>
 """
     
-    page = render_base(
-        title=f"错误 {status_code}",
-        content=content
-    )
-    return page.encode("utf-8")
+    return b"".join((
+        _ERROR_PAGE_HEAD,
+        f"错误 {status_code}".encode("utf-8"),
+        _ERROR_PAGE_MID,
+        content.encode("utf-8"),
+        _ERROR_PAGE_TAIL,
+    ))